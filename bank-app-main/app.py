@@ -1,5 +1,6 @@
 from flask import Flask, render_template, request, redirect, url_for, flash
 from controllers.auth_controller import AuthController
+from controllers.asset_controller import AssetController
 from flask import session
 from models.user_model import UserModel
 import csv
@@ -8,12 +9,20 @@ from flask import make_response
 app = Flask(__name__)
 app.secret_key = "your_secret_key"  # For flash messages
 
+# Fingerprint and precompress static files once at startup
+AssetController.build(app.static_folder)
+app.add_template_global(AssetController.asset_url, "asset_url")
+
 
 # Routes
 @app.route("/")
 def home():
     return redirect(url_for("login"))
 
+@app.route("/assets/<path:filename>")
+def assets(filename):
+    return AssetController.serve(filename)
+
 ## Register
 @app.route("/register", methods=["GET", "POST"])
 def register():
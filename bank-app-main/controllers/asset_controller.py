@@ -0,0 +1,96 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+from flask import Response, abort, request, url_for
+
+# Older Python versions don't know AVIF and would serve it as application/octet-stream
+mimetypes.add_type("image/avif", ".avif")
+
+
+class AssetController:
+    hash_length = 12
+    max_age = 31536000  # One year; fingerprinted files never change under the same name
+    compressible_types = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+    manifest = {}  # Logical name (e.g. "images/logo.jpg") -> fingerprinted name
+    assets = {}  # Fingerprinted name -> body, gzip body, mimetype and etag
+
+    @staticmethod
+    def fingerprint(filename, body):
+        """Insert a content hash before the file extension: styles.css -> styles.<hash>.css."""
+        digest = hashlib.sha256(body).hexdigest()[:AssetController.hash_length]
+        root, extension = os.path.splitext(filename)
+        return f"{root}.{digest}{extension}", digest
+
+    @staticmethod
+    def is_compressible(mimetype):
+        """Only text-like assets benefit from gzip; images are already compressed."""
+        return mimetype.startswith(AssetController.compressible_types)
+
+    @staticmethod
+    def build(static_folder):
+        """Fingerprint and precompress every file under the static folder."""
+        manifest = {}
+        assets = {}
+
+        for directory, _, filenames in os.walk(static_folder):
+            for name in filenames:
+                if name.startswith("."):
+                    continue
+
+                path = os.path.join(directory, name)
+                logical_name = os.path.relpath(path, static_folder).replace(os.sep, "/")
+                with open(path, "rb") as file:
+                    body = file.read()
+
+                fingerprinted_name, digest = AssetController.fingerprint(logical_name, body)
+                mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+                compressed = None
+                if AssetController.is_compressible(mimetype):
+                    # mtime=0 keeps the gzip output identical across restarts
+                    compressed = gzip.compress(body, compresslevel=9, mtime=0)
+                    if len(compressed) >= len(body):
+                        compressed = None
+
+                manifest[logical_name] = fingerprinted_name
+                assets[fingerprinted_name] = {
+                    "body": body,
+                    "gzip": compressed,
+                    "mimetype": mimetype,
+                    "etag": digest,
+                }
+
+        AssetController.manifest = manifest
+        AssetController.assets = assets
+
+    @staticmethod
+    def asset_url(filename):
+        """Template helper: URL of the fingerprinted asset, or the plain static URL if unknown."""
+        fingerprinted_name = AssetController.manifest.get(filename)
+        if fingerprinted_name is None:
+            return url_for("static", filename=filename)
+        return url_for("assets", filename=fingerprinted_name)
+
+    @staticmethod
+    def serve(filename):
+        """Serve a fingerprinted asset with immutable cache headers, gzipped when accepted."""
+        asset = AssetController.assets.get(filename)
+        if asset is None:
+            abort(404)
+
+        use_gzip = asset["gzip"] is not None and request.accept_encodings["gzip"] > 0
+        body = asset["gzip"] if use_gzip else asset["body"]
+
+        response = Response(body, mimetype=asset["mimetype"])
+        response.headers["Cache-Control"] = f"public, max-age={AssetController.max_age}, immutable"
+        if asset["gzip"] is not None:
+            response.headers["Vary"] = "Accept-Encoding"
+        if use_gzip:
+            response.headers["Content-Encoding"] = "gzip"
+            response.set_etag(f"{asset['etag']}-gzip")
+        else:
+            response.set_etag(asset["etag"])
+
+        return response.make_conditional(request)